@@ -38,11 +38,14 @@ Note:
 
 import sys
 import os
+import json
+import time
 import getpass
 import socket
 from datetime import datetime, timedelta
 import platform
 import subprocess
+from xml.sax.saxutils import escape
 import requests  # for location lookup
 
 from PyQt6 import QtWidgets, QtCore
@@ -50,11 +53,10 @@ from PyQt6.QtWidgets import QMessageBox
 
 from reportlab.lib.pagesizes import A4
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, HRFlowable, PageBreak
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER
-
-from PyPDF2 import PdfReader, PdfWriter
+from reportlab.lib.pdfencrypt import StandardEncryption
 
 from mainwindow import Ui_MainWindow  # your generated UI file
 
@@ -65,6 +67,69 @@ GITHUB_URL = "https://github.com/scarecrow021/Time-Keeper.git"  # example
 APP_VERSION = "1.3.0"
 IDEAL_WORK_HOURS = 8
 ACTUAL_WORK_HOURS = 10
+LOCATION_KEYS = ["ip", "city", "region", "country", "loc", "postal", "timezone"]
+# Window without a minimize button
+WINDOW_FLAGS = (
+    QtCore.Qt.WindowType.Window |
+    QtCore.Qt.WindowType.WindowTitleHint |
+    QtCore.Qt.WindowType.WindowCloseButtonHint |
+    QtCore.Qt.WindowType.CustomizeWindowHint
+)
+PDF_FLUSH_INTERVAL_MS = 30000  # write the PDF at most this long after a log submission
+LOCATION_CACHE_PATH = os.path.join(LOG_DIR, ".location_cache.json")
+LOCATION_CACHE_TTL = 24 * 60 * 60  # seconds
+
+# Shared HTTP session so connections can be reused across lookups
+http_session = requests.Session()
+
+DISCLAIMER_TEXT = (
+    f"This file is generated by the Time-Keeper application (c) 2025, Soumik Sarkar, "
+    f"available at {GITHUB_URL}, written under MIT license, version {APP_VERSION}.\n\n"
+    "This file is a secured PDF; its metadata can be checked for authenticity.\n\n"
+    "The content of this PDF reflects verbatim the log messages submitted by the user. "
+    "Users are not allowed to modify or erase log messages.\n\n"
+    "The application encourages keeping it open throughout the workday to capture authentic logs. "
+    "If the file seems tampered with, or the logged times do not reflect the actual work time claimed, "
+    "this PDF should not be accepted."
+)
+
+# --- PDF Styles (reusable across documents) ---
+TITLE_STYLE = ParagraphStyle(
+    name="Title",
+    fontName="Helvetica-Bold",
+    fontSize=18,
+    alignment=TA_CENTER,
+    spaceAfter=24
+)
+
+TIMESTAMP_STYLE = ParagraphStyle(
+    name="Timestamp",
+    fontName="Helvetica-Bold",
+    fontSize=11,
+    textColor=colors.darkblue,
+    spaceAfter=2
+)
+
+LOG_STYLE = ParagraphStyle(
+    name="Log",
+    fontName="Helvetica",
+    fontSize=11,
+    leftIndent=12,
+    spaceAfter=12
+)
+
+COPYRIGHT_STYLE = ParagraphStyle(
+    name="Copyright",
+    fontName="Helvetica",
+    fontSize=10,
+    alignment=TA_CENTER,
+    textColor=colors.darkgray,
+    spaceAfter=12
+)
+
+# Copyright page content never changes, so it is parsed once and reused;
+# it always sits alone on its page and is re-wrapped on every build
+DISCLAIMER_PARAGRAPH = Paragraph(DISCLAIMER_TEXT, COPYRIGHT_STYLE)
 
 # --- Utility functions ---
 def get_system_info():
@@ -77,11 +142,21 @@ def get_system_info():
 
     try:
         if system == "Windows":
-            # Try using wmic (no external modules needed)
-            make = subprocess.check_output(["wmic", "computersystem", "get", "manufacturer"]).decode().split("\n")[1].strip()
-            model = subprocess.check_output(["wmic", "computersystem", "get", "model"]).decode().split("\n")[1].strip()
-            info["make"] = make or "Unknown"
-            info["model"] = model or "Unknown"
+            try:
+                # BIOS registry key holds the same data, no process spawn needed
+                import winreg
+                with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"HARDWARE\DESCRIPTION\System\BIOS") as k:
+                    make = winreg.QueryValueEx(k, "SystemManufacturer")[0]
+                    model = winreg.QueryValueEx(k, "SystemProductName")[0]
+            except Exception:
+                # Fall back to a single CIM query
+                output = subprocess.check_output([
+                    "powershell", "-NoProfile", "-Command",
+                    "$c = Get-CimInstance Win32_ComputerSystem; $c.Manufacturer; $c.Model"
+                ]).decode().splitlines()
+                make, model = (line.strip() for line in output[:2])
+            info["make"] = make.strip() or "Unknown"
+            info["model"] = model.strip() or "Unknown"
 
         elif system == "Darwin":  # macOS
             make = "Apple"
@@ -103,17 +178,58 @@ def get_system_info():
 
     return info
 
+def load_cached_location():
+    """Return the cached location dict if it is fresh enough, else None."""
+    try:
+        if time.time() - os.path.getmtime(LOCATION_CACHE_PATH) > LOCATION_CACHE_TTL:
+            return None
+        with open(LOCATION_CACHE_PATH) as f:
+            data = json.load(f)
+        return {k: data.get(k, "") for k in LOCATION_KEYS}
+    except Exception:
+        return None
+
+def save_cached_location(location):
+    """Atomically write the location dict to the on-disk cache."""
+    try:
+        os.makedirs(LOG_DIR, exist_ok=True)
+        tmp_path = LOCATION_CACHE_PATH + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(location, f)
+        os.replace(tmp_path, LOCATION_CACHE_PATH)
+    except Exception:
+        pass
+
 def get_location():
     """Return full location info as a dictionary."""
+    cached = load_cached_location()
+    if cached is not None:
+        return cached
     try:
-        response = requests.get("https://ipinfo.io/json", timeout=5)
+        # Short connect timeout so offline launches fail fast
+        response = http_session.get("https://ipinfo.io/json", timeout=(1.0, 3.0),
+                                    allow_redirects=False)
+        response.raise_for_status()
         data = response.json()
         # Ensure all keys exist even if missing
-        keys = ["ip", "city", "region", "country", "loc", "postal", "timezone"]
-        return {k: data.get(k, "") for k in keys}
+        location = {k: data.get(k, "") for k in LOCATION_KEYS}
     except:
         # Return empty strings if API fails
-        return {k: "" for k in ["ip", "city", "region", "country", "loc", "postal", "timezone"]}
+        return {k: "" for k in LOCATION_KEYS}
+    # Only cache real answers, not error bodies that parse as empty
+    if location["ip"]:
+        save_cached_location(location)
+    return location
+
+class InfoWorker(QtCore.QObject):
+    """
+    Collects system and location info off the UI thread.
+    Emits finished(system_info, location) when done.
+    """
+    finished = QtCore.pyqtSignal(dict, dict)
+
+    def run(self):
+        self.finished.emit(get_system_info(), get_location())
 
 def create_pdf_path():
     if not os.path.exists(LOG_DIR):
@@ -121,61 +237,55 @@ def create_pdf_path():
     today_str = datetime.now().strftime("%d_%m_%Y")
     return os.path.join(LOG_DIR, f"{today_str}.pdf")
 
-def format_timedelta(td: timedelta) -> str:
-    """Return HH:MM:SS string for a timedelta"""
-    total_seconds = int(td.total_seconds())
-    hours, remainder = divmod(total_seconds, 3600)
-    minutes, seconds = divmod(remainder, 60)
-    return f"{hours:02}:{minutes:02}:{seconds:02}"
-
-def build_pdf(pdf_path, log_entries, header_info):
+def ms_until_next_second() -> int:
+    """Return milliseconds until the next wall-clock second boundary"""
+    return 1000 - int(time.time() * 1000) % 1000
+
+# Translation table used to blank the colons on the blinking LCDs
+COLON_BLANK = str.maketrans(":", " ")
+
+def format_timedelta(total: int) -> str:
+    """Return HH:MM:SS string for a number of seconds"""
+    if 0 <= total < 86400:
+        # C-level strftime is cheaper than the manual split below
+        return time.strftime("%H:%M:%S", time.gmtime(total))
+    s = total
+    h = s // 3600
+    s -= h * 3600
+    m = s // 60
+    s -= m * 60
+    return f"{h:02d}:{m:02d}:{s:02d}"
+
+def lcd_stylesheet(color: str) -> str:
+    """Return the QLCDNumber stylesheet for the given digit color"""
+    return f"""
+            QLCDNumber {{
+                background-color: #000000;
+                color: {color};
+                border: 2px solid #333333;
+                border-radius: 6px;
+                padding: 4px;
+            }}
+        """
+
+# Prebuilt stylesheets for the fixed LCD palette
+LCD_STYLESHEETS = {color: lcd_stylesheet(color) for color in (
+    "#B0B0B0",  # grey
+    "#00FF00",  # green
+    "#FFD300",  # amber
+    "#FF3B30",  # red (time remaining alert)
+    "#00BFFF",  # blue
+    "#FF00FF",  # magenta
+)}
+
+def build_header_story(header_info):
     """
-    Build an enhanced PDF with header info and logs, including a copyright page.
+    Return the flowables for the title and the header info table.
     """
-    doc = SimpleDocTemplate(pdf_path, pagesize=A4,
-                            rightMargin=40, leftMargin=40,
-                            topMargin=60, bottomMargin=40)
-    styles = getSampleStyleSheet()
-
-    # --- Styles ---
-    title_style = ParagraphStyle(
-        name="Title",
-        fontName="Helvetica-Bold",
-        fontSize=18,
-        alignment=TA_CENTER,
-        spaceAfter=24
-    )
-
-    timestamp_style = ParagraphStyle(
-        name="Timestamp",
-        fontName="Helvetica-Bold",
-        fontSize=11,
-        textColor=colors.darkblue,
-        spaceAfter=2
-    )
-
-    log_style = ParagraphStyle(
-        name="Log",
-        fontName="Helvetica",
-        fontSize=11,
-        leftIndent=12,
-        spaceAfter=12
-    )
-
-    copyright_style = ParagraphStyle(
-        name="Copyright",
-        fontName="Helvetica",
-        fontSize=10,
-        alignment=TA_CENTER,
-        textColor=colors.darkgray,
-        spaceAfter=12
-    )
-
-    # --- Story ---
     story = []
 
     # Title with dynamic date
-    story.append(Paragraph(f"Time-Keeper : [{header_info['login_date']}]", title_style))
+    story.append(Paragraph(f"Time-Keeper : [{header_info['login_date']}]", TITLE_STYLE))
 
     # Header Info Table
     location_info = header_info["location"]
@@ -192,7 +302,7 @@ def build_pdf(pdf_path, log_entries, header_info):
     ]
 
     # Add location info rows
-    for key in ["ip", "city", "region", "country", "loc", "postal", "timezone"]:
+    for key in LOCATION_KEYS:
         data.append([f"{key.capitalize()}:", location_info.get(key, "")])
 
     table = Table(data, colWidths=[120, 330])
@@ -207,38 +317,65 @@ def build_pdf(pdf_path, log_entries, header_info):
     story.append(table)
     story.append(Spacer(1, 12))
     story.append(HRFlowable(width="100%", thickness=1, color="#000000", spaceBefore=12, spaceAfter=12))
+    return story
+
+def make_log_entry(timestamp, msg):
+    """
+    Return the (timestamp, message) Paragraph pair for a log entry.
+    The message is escaped so user text is rendered verbatim, line breaks included.
+    """
+    safe = escape(msg).replace("\n", "<br/>")
+    return Paragraph(timestamp, TIMESTAMP_STYLE), Paragraph(safe, LOG_STYLE)
+
+def build_entries_table(timestamps, messages, width):
+    """
+    Return a single zebra-striped Table holding every pre-built log entry.
+    timestamps and messages are parallel lists of Paragraphs.
+    """
+    # Table data is row-major, so pair the columns up here
+    rows = [[ts, msg] for ts, msg in zip(timestamps, messages)]
+    # Wide enough for a "%d-%m-%Y - %H:%M:%S" timestamp on one line
+    table = Table(rows, colWidths=[145, width - 145])
+    table.setStyle(TableStyle([
+        ('ROWBACKGROUNDS', (0,0), (-1,-1), [colors.whitesmoke, colors.lightgrey]),
+        ('BOX', (0,0), (-1,-1), 0.25, colors.grey),
+        ('VALIGN', (0,0), (-1,-1), 'TOP'),
+        ('LEFTPADDING', (0,0), (-1,-1), 6),
+        ('RIGHTPADDING', (0,0), (-1,-1), 6),
+        ('TOPPADDING', (0,0), (-1,-1), 4),
+        ('BOTTOMPADDING', (0,0), (-1,-1), 4)
+    ]))
+    return table
+
+def build_pdf(pdf_path, timestamps, messages, header_info, finalize=False, header_story=None):
+    """
+    Build an enhanced PDF with header info and logs, including a copyright page.
+    When finalize is set the PDF is encrypted so it is readable but not editable.
+    A previously built header_story may be passed in to skip rebuilding it.
+    The PDF is written to a temp file first and swapped in atomically.
+    """
+    tmp_path = pdf_path + ".tmp"
+    # Empty passwords: anyone can open and print, nobody can modify
+    # 128-bit to match the protection of the former PyPDF2 pass
+    encrypt = StandardEncryption("", ownerPassword="", canModify=0, canPrint=1,
+                                 strength=128) if finalize else None
+    doc = SimpleDocTemplate(tmp_path, pagesize=A4,
+                            rightMargin=40, leftMargin=40,
+                            topMargin=60, bottomMargin=40,
+                            encrypt=encrypt)
+
+    # --- Story ---
+    if header_story is None:
+        header_story = build_header_story(header_info)
+    story = list(header_story)
 
     # Logs
-    for i, (ts, msg) in enumerate(log_entries):
-        bg_color = colors.whitesmoke if i % 2 == 0 else colors.lightgrey
-        entry_table = Table([
-            [Paragraph(ts, timestamp_style)],
-            [Paragraph(msg, log_style)]
-        ], colWidths=[doc.width])
-        entry_table.setStyle(TableStyle([
-            ('BACKGROUND', (0,0), (-1,-1), bg_color),
-            ('BOX', (0,0), (-1,-1), 0.25, colors.grey),
-            ('LEFTPADDING', (0,0), (-1,-1), 6),
-            ('RIGHTPADDING', (0,0), (-1,-1), 6),
-            ('TOPPADDING', (0,0), (-1,-1), 4),
-            ('BOTTOMPADDING', (0,0), (-1,-1), 4)
-        ]))
-        story.append(entry_table)
-        story.append(Spacer(1, 6))
+    if timestamps:
+        story.append(build_entries_table(timestamps, messages, doc.width))
 
     # --- Add Copyright Page ---
     story.append(PageBreak())
-    disclaimer_text = (
-        f"This file is generated by the Time-Keeper application (c) 2025, Soumik Sarkar, "
-        f"available at {GITHUB_URL}, written under MIT license, version {APP_VERSION}.\n\n"
-        "This file is a secured PDF; its metadata can be checked for authenticity.\n\n"
-        "The content of this PDF reflects verbatim the log messages submitted by the user. "
-        "Users are not allowed to modify or erase log messages.\n\n"
-        "The application encourages keeping it open throughout the workday to capture authentic logs. "
-        "If the file seems tampered with, or the logged times do not reflect the actual work time claimed, "
-        "this PDF should not be accepted."
-    )
-    story.append(Paragraph(disclaimer_text, copyright_style))
+    story.append(DISCLAIMER_PARAGRAPH)
 
     # --- Page Number Footer ---
     def add_page_number(canvas, doc):
@@ -246,21 +383,16 @@ def build_pdf(pdf_path, log_entries, header_info):
         canvas.setFont('Helvetica', 9)
         canvas.drawRightString(A4[0] - 40, 20, f"Page {page_num}")
 
-    doc.build(story, onFirstPage=add_page_number, onLaterPages=add_page_number)
-
-def make_pdf_non_editable(pdf_path):
-    """
-    Make PDF non-editable but readable. Overwrites original PDF.
-    """
-    reader = PdfReader(pdf_path)
-    writer = PdfWriter()
-    for page in reader.pages:
-        writer.add_page(page)
-    # Encrypt with empty passwords to prevent editing
-    writer.encrypt(user_password="", owner_password="", use_128bit=True)
-    with open(pdf_path, "wb") as f:
-        writer.write(f)
-    return pdf_path
+    try:
+        doc.build(story, onFirstPage=add_page_number, onLaterPages=add_page_number)
+        # Flush the data to disk before the rename so a crash can't leave a torn file
+        with open(tmp_path, "rb+") as f:
+            os.fsync(f.fileno())
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, pdf_path)
 
 # --- Main Window ---
 class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
@@ -272,23 +404,25 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         self.setWindowTitle(f"Time-Keeper : [{datetime.now().strftime('%d/%m/%Y')}]")
 
         # --- Disable minimize ---
-        self.setWindowFlags(
-            QtCore.Qt.WindowType.Window |
-            QtCore.Qt.WindowType.WindowTitleHint |
-            QtCore.Qt.WindowType.WindowCloseButtonHint |
-            QtCore.Qt.WindowType.CustomizeWindowHint
-        )
+        self.setWindowFlags(WINDOW_FLAGS)
 
         # --- Timer setup ---
         self.start_time = datetime.now()
         self.end_time = self.start_time + timedelta(hours=IDEAL_WORK_HOURS)
         self.show_colons = True
+        self._remaining_alert_state = False
+        self._last_now_s = None
         self.leave_time = self.start_time + timedelta(hours=ACTUAL_WORK_HOURS)
 
+        # Anchors as epoch seconds so the per-tick math stays integer only
+        self._start_s = int(self.start_time.timestamp())
+        self._end_s = int(self.end_time.timestamp())
+        self._leave_s = int(self.leave_time.timestamp())
+
         # --- Setup LCDs ---
         self.setup_lcd(self.timeStarted, "#B0B0B0")   # grey
         self.setup_lcd(self.timeSpent, "#00FF00")     # green
-        self.setup_lcd(self.timeRemaining, "#FFD300") # amber
+        self.setup_lcd(self.timeRemaining, "#FFD300", "#FF3B30") # amber, red alert
         self.setup_lcd(self.currentTime, "#00BFFF")   # blue
         self.setup_lcd(self.countdown, "#FF00FF")     # magenta
         self.timeStarted.display(self.start_time.strftime("%H:%M:%S"))
@@ -298,23 +432,28 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         self.leaveTimeEdit.setTime(self.leave_time.time())
         self.leaveTimeEdit.timeChanged.connect(self.update_leave_time)
 
-        # --- Timer ---
+        # --- Timer (re-armed each tick to stay on the second boundary) ---
         self.timer = QtCore.QTimer(self)
-        self.timer.timeout.connect(self.update_times)
-        self.timer.start(1000)
-        self.update_times()
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self._tick)
+        self._tick()
 
         # --- Logging ---
         self.pdf_path = create_pdf_path()
-        self.log_entries = []
+        self._timestamps = []  # timestamp Paragraphs
+        self._messages = []    # message Paragraphs, parallel to _timestamps
 
         # Auto-filled header info
         self.user_name = getpass.getuser()
         self.pc_name = socket.gethostname()
         self.login_time = self.start_time.strftime("%H:%M:%S")
         self.login_date = self.start_time.strftime("%d/%m/%Y")
-        self.system_info = get_system_info()
-        self.location = get_location()
+        self.system_info = {"make": "Unknown", "model": "Unknown"}
+        self.location = {k: "" for k in LOCATION_KEYS}
+        self._header_version = 0
+        self._header_story = None
+        self._header_story_version = -1
         self.header_info = {
             "user_name": self.user_name,
             "login_date": self.login_date,
@@ -327,68 +466,116 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
             "hours_worked": "--:--:--"
         }
 
-        build_pdf(self.pdf_path, self.log_entries, self.header_info)
+        # System & location lookups are slow, fill them in once available
+        self._info_received = False
+        self.info_worker = InfoWorker()
+        self.info_worker.finished.connect(self.update_header_info)
+        QtCore.QThreadPool.globalInstance().start(self.info_worker.run)
+
+        # --- Debounced PDF flush (written on submit idle and on close) ---
+        self.flush_timer = QtCore.QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.timeout.connect(self._flush_pdf)
 
         # --- Submit button ---
         self.submitButton.clicked.connect(self.handle_submit)
 
+    # --- Background info lookup finished ---
+    def update_header_info(self, system_info, location):
+        self._info_received = True
+        self.system_info = system_info
+        self.location = location
+        self.set_header_info(
+            system_make=system_info["make"],
+            system_model=system_info["model"],
+            location=location
+        )
+
+    # --- Make sure the lookup results are in before the final PDF ---
+    def wait_for_header_info(self):
+        if self._info_received:
+            return
+        QtCore.QThreadPool.globalInstance().waitForDone()
+        # Deliver the queued finished signal from the worker thread
+        QtCore.QCoreApplication.processEvents()
+        if not self._info_received:
+            self.update_header_info(get_system_info(), get_location())
+
+    # --- Header info changes invalidate the cached header flowables ---
+    def set_header_info(self, **fields):
+        self.header_info.update(fields)
+        self._header_version += 1
+
+    def header_story(self):
+        if self._header_story_version != self._header_version:
+            self._header_story = build_header_story(self.header_info)
+            self._header_story_version = self._header_version
+        return self._header_story
+
     # --- LCD Setup ---
-    def setup_lcd(self, lcd, color):
+    def setup_lcd(self, lcd, color, alert_color=None):
         lcd.setSegmentStyle(QtWidgets.QLCDNumber.SegmentStyle.Filled)
         lcd.setDigitCount(8)
-        lcd.setStyleSheet(f"""
-            QLCDNumber {{
-                background-color: #000000;
-                color: {color};
-                border: 2px solid #333333;
-                border-radius: 6px;
-                padding: 4px;
-            }}
-        """)
+        # Keep both finished variants so alerts are a plain swap
+        lcd._ss_normal = LCD_STYLESHEETS[color]
+        lcd._ss_alert = LCD_STYLESHEETS[alert_color or color]
+        lcd.setStyleSheet(lcd._ss_normal)
         lcd.display("--:--:--")
 
     # --- Leave Time Edit Changed ---
     def update_leave_time(self, qtime):
         today = datetime.today()
         self.leave_time = datetime.combine(today, qtime.toPyTime())
+        self._leave_s = int(self.leave_time.timestamp())
 
     # --- Format time with blinking colon ---
-    def format_time(self, dt: datetime) -> str:
-        text = dt.strftime("%H:%M:%S")
-        if not self.show_colons:
-            text = text.replace(":", " ")
-        return text
+    def format_time(self, epoch_s: int) -> str:
+        return self.blink(time.strftime("%H:%M:%S", time.localtime(epoch_s)))
+
+    # --- Timer tick ---
+    def _tick(self):
+        self.update_times()
+        self.timer.start(ms_until_next_second())
 
     # --- Update LCDs ---
     def update_times(self):
-        now = datetime.now()
+        now_s = int(time.time())
+        if now_s == self._last_now_s:
+            return
+        self._last_now_s = now_s
         self.show_colons = not self.show_colons
 
         # Current time
-        self.currentTime.display(self.format_time(now))
+        self.currentTime.display(self.format_time(now_s))
 
         # Time spent
-        elapsed = now - self.start_time
-        self.timeSpent.display(format_timedelta(elapsed) if self.show_colons else format_timedelta(elapsed).replace(":", " "))
+        elapsed_s = now_s - self._start_s
+        self.timeSpent.display(self.blink(format_timedelta(elapsed_s)))
 
         # Time remaining
-        remaining = self.end_time - now
-        if remaining.total_seconds() <= 0:
+        remaining_s = self._end_s - now_s
+        if remaining_s <= 0:
             self.timeRemaining.display("00:00:00")
-            self.timeRemaining.setStyleSheet(self.timeRemaining.styleSheet().replace("#FFD300", "#FF3B30"))
         else:
-            self.timeRemaining.display(format_timedelta(remaining) if self.show_colons else format_timedelta(remaining).replace(":", " "))
-            if remaining.total_seconds() < 1800:
-                self.timeRemaining.setStyleSheet(self.timeRemaining.styleSheet().replace("#FFD300", "#FF3B30"))
-            else:
-                self.timeRemaining.setStyleSheet(self.timeRemaining.styleSheet().replace("#FF3B30", "#FFD300"))
+            self.timeRemaining.display(self.blink(format_timedelta(remaining_s)))
+
+        # Only touch the stylesheet when crossing the 30 minute threshold
+        should_alert = remaining_s < 1800
+        if should_alert != self._remaining_alert_state:
+            self._remaining_alert_state = should_alert
+            lcd = self.timeRemaining
+            lcd.setStyleSheet(lcd._ss_alert if should_alert else lcd._ss_normal)
 
         # Countdown
-        countdown_delta = self.leave_time - now
-        if countdown_delta.total_seconds() <= 0:
+        countdown_s = self._leave_s - now_s
+        if countdown_s <= 0:
             self.countdown.display("00:00:00")
         else:
-            self.countdown.display(format_timedelta(countdown_delta) if self.show_colons else format_timedelta(countdown_delta).replace(":", " "))
+            self.countdown.display(self.blink(format_timedelta(countdown_s)))
+
+    # --- Blank the colons on alternate ticks ---
+    def blink(self, text: str) -> str:
+        return text if self.show_colons else text.translate(COLON_BLANK)
 
     # --- Submit button ---
     def handle_submit(self):
@@ -396,10 +583,19 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         if not msg:
             return
         timestamp = datetime.now().strftime("%d-%m-%Y - %H:%M:%S")
-        self.log_entries.append((timestamp, msg))
-        build_pdf(self.pdf_path, self.log_entries, self.header_info)
+        ts_para, msg_para = make_log_entry(timestamp, msg)
+        self._timestamps.append(ts_para)
+        self._messages.append(msg_para)
+        # Don't restart a pending flush, so unsaved entries are never older than the interval
+        if not self.flush_timer.isActive():
+            self.flush_timer.start(PDF_FLUSH_INTERVAL_MS)
         self.logMessage.clear()
 
+    # --- Write pending log entries to disk ---
+    def _flush_pdf(self):
+        build_pdf(self.pdf_path, self._timestamps, self._messages, self.header_info,
+                  header_story=self.header_story())
+
     # --- Close Event ---
     def closeEvent(self, event):
         text, ok = QtWidgets.QInputDialog.getText(
@@ -410,12 +606,16 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         )
         if ok and text == PASSWORD:
             # Update logout time & hours worked
-            self.header_info["logout_time"] = datetime.now().strftime("%H:%M:%S")
-            worked_time = datetime.now() - self.start_time
-            self.header_info["hours_worked"] = format_timedelta(worked_time)
-
-            build_pdf(self.pdf_path, self.log_entries, self.header_info)
-            make_pdf_non_editable(self.pdf_path)
+            worked_s = int((datetime.now() - self.start_time).total_seconds())
+            self.set_header_info(
+                logout_time=datetime.now().strftime("%H:%M:%S"),
+                hours_worked=format_timedelta(worked_s)
+            )
+
+            self.flush_timer.stop()
+            self.wait_for_header_info()
+            build_pdf(self.pdf_path, self._timestamps, self._messages, self.header_info,
+                      finalize=True, header_story=self.header_story())
             QMessageBox.information(self, "Log Saved", f"Daily log saved at:\n{self.pdf_path}")
             event.accept()
         else: